@@ -10,6 +10,8 @@ import asyncio
 import sys
 from pathlib import Path
 from datetime import datetime
+from string import Template
+from typing import List, Optional, Tuple
 from dotenv import load_dotenv
 
 # Add project root to path for plugin imports
@@ -21,6 +23,133 @@ from plugins.jira.api import JiraAPI
 
 load_dotenv()
 
+_COMMIT_MESSAGE_TEMPLATE = Template(
+    "$task_id: Create initial project setup\n\n"
+    "🤖 Generated with automated workflow\n\n"
+    "Created WebAPI project structure with default configuration."
+)
+
+_PR_COMMENT_TEMPLATE = Template(
+    """✅ **Automated Development Workflow Completed Successfully**
+
+Task: $task_id
+Status: Implementation Complete  
+Branch: $branch_name
+Pull Request: $pr_url
+Completed: $completed
+
+**Implementation Summary:**
+- Created initial .NET WebAPI project structure
+- Added default configuration and launch settings
+- Project ready for development and deployment
+
+The automated development workflow has successfully completed the implementation. Please review the pull request and merge when ready."""
+)
+
+_COMMENT_TEMPLATE = Template(
+    """✅ **Automated Development Workflow Completed**
+
+Task: $task_id
+Status: Complete
+Branch: $branch_name
+Completed: $completed
+
+The automated development workflow has completed successfully."""
+)
+
+
+async def update_jira(
+    task_id: str, branch_name: str, pr_url: Optional[str]
+) -> List[str]:
+    """Move the task to Done and add the completion comment.
+
+    Returns the progress lines to print, so output does not interleave with
+    the concurrently running cleanup.
+    """
+    lines = []
+    try:
+        jira_api = JiraAPI()
+    except Exception as e:
+        return [f"   ⚠️ Jira update warning: {str(e)}"]
+
+    # Get available transitions; the comment is posted even if this fails
+    target_status = None
+    try:
+        transitions = await jira_api.get_transitions_async(task_id)
+        transition_names = [t["name"] for t in transitions.get("transitions", [])]
+        lines.append(f"   📋 Available transitions: {', '.join(transition_names)}")
+
+        if "Done" in transition_names:
+            target_status = "Done"
+        elif transition_names:
+            target_status = transition_names[0]
+        else:
+            lines.append(f"   ⚠️ No transitions available for {task_id}")
+    except Exception as e:
+        lines.append(f"   ⚠️ Jira update warning: {str(e)}")
+
+    completed = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    if pr_url:
+        comment = _PR_COMMENT_TEMPLATE.substitute(
+            task_id=task_id,
+            branch_name=branch_name,
+            pr_url=pr_url,
+            completed=completed,
+        )
+    else:
+        comment = _COMMENT_TEMPLATE.substitute(
+            task_id=task_id, branch_name=branch_name, completed=completed
+        )
+
+    # The comment does not depend on the transition result
+    calls = [jira_api.add_comment_async(task_id, comment)]
+    if target_status:
+        calls.append(jira_api.transition_issue_async(task_id, target_status))
+    comment_result, *transition_results = await asyncio.gather(
+        *calls, return_exceptions=True
+    )
+
+    for transition_result in transition_results:
+        if isinstance(transition_result, Exception):
+            lines.append(f"   ⚠️ Jira update warning: {str(transition_result)}")
+        elif transition_result.get("success", False):
+            lines.append(f"   ✅ Task moved to {target_status}!")
+        else:
+            lines.append(
+                f"   ⚠️ Failed to move task: {transition_result.get('error', 'Unknown error')}"
+            )
+
+    if isinstance(comment_result, Exception):
+        lines.append(f"   ⚠️ Jira comment warning: {str(comment_result)}")
+    elif comment_result.get("success", False):
+        lines.append(f"   ✅ Completion comment added!")
+    else:
+        lines.append(
+            f"   ⚠️ Failed to add comment: {comment_result.get('error', 'Unknown error')}"
+        )
+
+    return lines
+
+
+async def cleanup_temp_dir(temp_dir: Path) -> Tuple[bool, List[str]]:
+    """Remove the temp directory without blocking the event loop.
+
+    Returns whether cleanup succeeded and the progress lines to print.
+    """
+    if not temp_dir.exists():
+        return True, [f"   ℹ️ Temp directory already clean"]
+
+    lines = [f"   🧹 Removing temp directory: {temp_dir}"]
+    try:
+        await asyncio.to_thread(shutil.rmtree, temp_dir)
+    except Exception as e:
+        lines.append(f"   ❌ Failed to remove temp directory: {str(e)}")
+        return False, lines
+
+    lines.append(f"   ✅ Temp directory cleaned")
+    lines.append(f"   ✅ /temp is empty")
+    return True, lines
+
 
 async def complete_workflow(task_id: str, branch_name: str):
     """Complete the remaining workflow steps."""
@@ -56,7 +185,7 @@ async def complete_workflow(task_id: str, branch_name: str):
             print(f"   🔄 Staging changes...")
             subprocess.run(["git", "add", "."], cwd=temp_dir, check=True)
 
-            commit_message = f"{task_id}: Create initial project setup\n\n🤖 Generated with automated workflow\n\nCreated WebAPI project structure with default configuration."
+            commit_message = _COMMIT_MESSAGE_TEMPLATE.substitute(task_id=task_id)
             subprocess.run(
                 ["git", "commit", "-m", commit_message], cwd=temp_dir, check=True
             )
@@ -78,84 +207,21 @@ async def complete_workflow(task_id: str, branch_name: str):
             print(f"   ℹ️ No changes detected")
             pr_url = None
 
-        # Step 2: Update Jira to Done
-        print(f"\n2️⃣ **UPDATING JIRA TO DONE**")
-
-        try:
-            jira_api = JiraAPI()
-
-            # Get available transitions
-            transitions = await jira_api.get_transitions_async(task_id)
-            transition_names = [t["name"] for t in transitions.get("transitions", [])]
-            print(f"   📋 Available transitions: {', '.join(transition_names)}")
-
-            # Move to Done
-            target_status = (
-                "Done" if "Done" in transition_names else transition_names[0]
-            )
-            result = await jira_api.transition_issue_async(task_id, target_status)
-
-            if result.get("success", False):
-                print(f"   ✅ Task moved to {target_status}!")
-            else:
-                print(
-                    f"   ⚠️ Failed to move task: {result.get('error', 'Unknown error')}"
-                )
-
-        except Exception as e:
-            print(f"   ⚠️ Jira update warning: {str(e)}")
-
-        # Step 3: Add completion comment
-        print(f"\n3️⃣ **ADDING COMPLETION COMMENT TO JIRA**")
-
-        try:
-            if pr_url:
-                comment = f"""✅ **Automated Development Workflow Completed Successfully**
-
-Task: {task_id}
-Status: Implementation Complete  
-Branch: {branch_name}
-Pull Request: {pr_url}
-Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-**Implementation Summary:**
-- Created initial .NET WebAPI project structure
-- Added default configuration and launch settings
-- Project ready for development and deployment
-
-The automated development workflow has successfully completed the implementation. Please review the pull request and merge when ready."""
-            else:
-                comment = f"""✅ **Automated Development Workflow Completed**
-
-Task: {task_id}
-Status: Complete
-Branch: {branch_name}
-Completed: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-The automated development workflow has completed successfully."""
-
-            result = await jira_api.add_comment_async(task_id, comment)
-
-            if result.get("success", False):
-                print(f"   ✅ Completion comment added!")
-            else:
-                print(
-                    f"   ⚠️ Failed to add comment: {result.get('error', 'Unknown error')}"
-                )
+        # Steps 2-3: Jira updates and temp cleanup are independent, run together
+        jira_lines, (cleaned, cleanup_lines) = await asyncio.gather(
+            update_jira(task_id, branch_name, pr_url),
+            cleanup_temp_dir(temp_dir),
+        )
 
-        except Exception as e:
-            print(f"   ⚠️ Jira comment warning: {str(e)}")
+        print(f"\n2️⃣ **UPDATING JIRA TO DONE AND ADDING COMPLETION COMMENT**")
+        print("\n".join(jira_lines))
 
-        # Step 4: Clean up temp directory
-        print(f"\n4️⃣ **CLEANING UP TEMP DIRECTORY**")
+        print(f"\n3️⃣ **CLEANING UP TEMP DIRECTORY**")
+        print("\n".join(cleanup_lines))
 
-        if temp_dir.exists():
-            print(f"   🧹 Removing temp directory: {temp_dir}")
-            shutil.rmtree(temp_dir)
-            print(f"   ✅ Temp directory cleaned")
-            print(f"   ✅ /temp is empty")
-        else:
-            print(f"   ℹ️ Temp directory already clean")
+        if not cleaned:
+            print(f"\n❌ **COMPLETION FAILED**: temp directory cleanup failed")
+            return False
 
         print(f"\n🎉 **WORKFLOW COMPLETION SUCCESS!**")
         if pr_url:
@@ -1,11 +1,12 @@
 """Plugin registry for managing plugin discovery, loading, and lifecycle"""
 
+import asyncio
 import importlib
 import importlib.util
 import inspect
 import logging
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, Type
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Type
 
 from .plugin_interface import BasePlugin, PluginError, PluginType, PluginValidationError
 
@@ -15,6 +16,9 @@ logger = logging.getLogger(__name__)
 class PluginRegistry:
     """Central registry for managing all plugins"""
 
+    # Upper bound on plugin lifecycle operations running at the same time
+    max_concurrent_operations: int = 8
+
     def __init__(self, plugins_dir: str = "plugins"):
         """Initialize plugin registry"""
         self._plugins: Dict[str, Dict[str, Type[BasePlugin]]] = {}
@@ -191,7 +195,10 @@ class PluginRegistry:
             return 0
 
         discovered_count = 0
-        self._plugin_paths.append(plugin_path)
+        # Rediscovery re-imports modules but records each directory only once
+        resolved_path = plugin_path.resolve()
+        if all(path.resolve() != resolved_path for path in self._plugin_paths):
+            self._plugin_paths.append(plugin_path)
 
         # Look for Python files in the plugin directory
         for py_file in plugin_path.glob("*_plugin.py"):
@@ -230,74 +237,108 @@ class PluginRegistry:
         logger.info(f"Discovered {discovered_count} plugins from {plugin_path}")
         return discovered_count
 
-    async def initialize_all_plugins(self) -> Dict[str, bool]:
-        """Initialize all plugin instances
+    async def _run_bounded(
+        self,
+        plugins: List[Tuple[str, BasePlugin]],
+        op: Callable[[str, BasePlugin], Awaitable[Any]],
+    ) -> Dict[str, Any]:
+        """Run an operation on several plugin instances concurrently
+
+        At most ``max_concurrent_operations`` operations run at once.
+
+        Args:
+            plugins: Snapshot of (plugin ID, instance) pairs to operate on
+            op: Coroutine function taking a plugin ID and instance
 
         Returns:
-            Dictionary mapping plugin IDs to initialization success status
+            Dictionary mapping plugin IDs to operation results, in input order
         """
-        results = {}
+        semaphore = asyncio.Semaphore(self.max_concurrent_operations)
 
-        for plugin_id, plugin_instance in self._instances.items():
-            try:
-                success = await plugin_instance.initialize()
-                results[plugin_id] = success
+        async def run(plugin_id: str, plugin_instance: BasePlugin) -> Any:
+            async with semaphore:
+                return await op(plugin_id, plugin_instance)
 
-                if success:
-                    logger.info(f"Successfully initialized plugin: {plugin_id}")
-                else:
-                    logger.error(f"Failed to initialize plugin: {plugin_id}")
+        results = await asyncio.gather(
+            *(run(plugin_id, plugin_instance) for plugin_id, plugin_instance in plugins)
+        )
+        return {plugin_id: result for (plugin_id, _), result in zip(plugins, results)}
 
-            except Exception as e:
-                logger.error(f"Exception initializing plugin {plugin_id}: {e}")
-                results[plugin_id] = False
+    async def initialize_all_plugins(self) -> Dict[str, bool]:
+        """Initialize all plugin instances concurrently
+
+        Returns:
+            Dictionary mapping plugin IDs to initialization success status
+        """
+        return await self._run_bounded(
+            list(self._instances.items()), self._initialize_plugin
+        )
+
+    async def _initialize_plugin(
+        self, plugin_id: str, plugin_instance: BasePlugin
+    ) -> bool:
+        """Initialize a single plugin instance, logging the outcome"""
+        try:
+            success = await plugin_instance.initialize()
 
-        return results
+            if success:
+                logger.info(f"Successfully initialized plugin: {plugin_id}")
+            else:
+                logger.error(f"Failed to initialize plugin: {plugin_id}")
+            return success
+
+        except Exception as e:
+            logger.error(f"Exception initializing plugin {plugin_id}: {e}")
+            return False
 
     async def cleanup_all_plugins(self) -> Dict[str, bool]:
-        """Cleanup all plugin instances
+        """Cleanup all plugin instances concurrently
 
         Returns:
             Dictionary mapping plugin IDs to cleanup success status
         """
-        results = {}
-
-        for plugin_id, plugin_instance in self._instances.items():
-            try:
-                success = await plugin_instance.cleanup()
-                results[plugin_id] = success
-
-                if success:
-                    logger.info(f"Successfully cleaned up plugin: {plugin_id}")
-                else:
-                    logger.error(f"Failed to cleanup plugin: {plugin_id}")
+        return await self._run_bounded(
+            list(self._instances.items()), self._cleanup_plugin
+        )
+
+    async def _cleanup_plugin(
+        self, plugin_id: str, plugin_instance: BasePlugin
+    ) -> bool:
+        """Cleanup a single plugin instance, logging the outcome"""
+        try:
+            success = await plugin_instance.cleanup()
 
-            except Exception as e:
-                logger.error(f"Exception cleaning up plugin {plugin_id}: {e}")
-                results[plugin_id] = False
+            if success:
+                logger.info(f"Successfully cleaned up plugin: {plugin_id}")
+            else:
+                logger.error(f"Failed to cleanup plugin: {plugin_id}")
+            return success
 
-        return results
+        except Exception as e:
+            logger.error(f"Exception cleaning up plugin {plugin_id}: {e}")
+            return False
 
     async def health_check_all_plugins(self) -> Dict[str, str]:
-        """Perform health check on all plugin instances
+        """Perform health check on all plugin instances concurrently
 
         Returns:
             Dictionary mapping plugin IDs to health status
         """
-        results = {}
-
-        for plugin_id, plugin_instance in self._instances.items():
-            try:
-                status = await plugin_instance.health_check()
-                results[plugin_id] = status.value
-
-            except Exception as e:
-                logger.error(
-                    f"Exception during health check for plugin {plugin_id}: {e}"
-                )
-                results[plugin_id] = "unknown"
+        return await self._run_bounded(
+            list(self._instances.items()), self._health_check_plugin
+        )
+
+    async def _health_check_plugin(
+        self, plugin_id: str, plugin_instance: BasePlugin
+    ) -> str:
+        """Health check a single plugin instance, returning its status value"""
+        try:
+            status = await plugin_instance.health_check()
+            return status.value
 
-        return results
+        except Exception as e:
+            logger.error(f"Exception during health check for plugin {plugin_id}: {e}")
+            return "unknown"
 
     def get_plugin_info(
         self, plugin_type: Optional[PluginType] = None
@@ -1,5 +1,6 @@
 """GitHub utility functions and tools."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import Any, Dict, Optional
@@ -88,8 +89,10 @@ class GitHubTools:
 
             commit_message = self.api.generate_commit_message(task_id, summary)
 
-            # Commit changes
-            commit_result = self.api.commit_changes(workspace_dir, commit_message)
+            # Git runs as a blocking subprocess, keep it off the event loop
+            commit_result = await asyncio.to_thread(
+                self.api.commit_changes, workspace_dir, commit_message
+            )
             if not commit_result["success"]:
                 return {
                     "success": False,
@@ -105,7 +108,9 @@ class GitHubTools:
                 }
 
             # Push branch
-            push_result = self.api.push_branch(workspace_dir, branch_name)
+            push_result = await asyncio.to_thread(
+                self.api.push_branch, workspace_dir, branch_name
+            )
             if not push_result["success"]:
                 return {
                     "success": False,
@@ -151,8 +156,6 @@ class GitHubTools:
         task_details: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Synchronous wrapper for complete_workflow_async."""
-        import asyncio
-
         return asyncio.run(
             self.complete_workflow_async(
                 workspace_dir, branch_name, task_id, task_details
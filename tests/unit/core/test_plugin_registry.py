@@ -1,7 +1,9 @@
 """Tests for plugin registry module."""
 
+import asyncio
+import importlib.util
 from pathlib import Path
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
 
 import pytest
 
@@ -45,6 +47,34 @@ class MockPlugin(BasePlugin):
         return PluginStatus.HEALTHY
 
 
+SAMPLE_PLUGIN_SOURCE = """
+from core.plugin_interface import BasePlugin, PluginStatus, PluginType
+
+
+class SamplePlugin(BasePlugin):
+    def get_plugin_type(self):
+        return PluginType.TASK_MANAGEMENT
+
+    def get_plugin_name(self):
+        return "sample"
+
+    def get_version(self):
+        return "1.0.0"
+
+    def validate_config(self):
+        return True
+
+    async def initialize(self):
+        return True
+
+    async def cleanup(self):
+        return True
+
+    async def health_check(self):
+        return PluginStatus.HEALTHY
+"""
+
+
 class InvalidPlugin:
     """Plugin that doesn't inherit from BasePlugin."""
 
@@ -203,6 +233,36 @@ class TestPluginRegistry:
         results = await self.registry.initialize_all_plugins()
         assert results["task_management.mock_plugin"] is True
 
+    @pytest.mark.asyncio
+    async def test_initialize_all_plugins_runs_concurrently(self):
+        """Test plugins initialize concurrently and failures stay isolated."""
+        started = asyncio.Event()
+
+        async def wait_for_peer():
+            await asyncio.wait_for(started.wait(), timeout=1)
+            return True
+
+        async def signal_peer():
+            started.set()
+            return True
+
+        waiting, signalling, failing = MagicMock(), MagicMock(), MagicMock()
+        waiting.initialize = AsyncMock(side_effect=wait_for_peer)
+        signalling.initialize = AsyncMock(side_effect=signal_peer)
+        failing.initialize = AsyncMock(side_effect=RuntimeError("boom"))
+        self.registry._instances = {
+            "task_management.waiting": waiting,
+            "task_management.signalling": signalling,
+            "task_management.failing": failing,
+        }
+
+        results = await self.registry.initialize_all_plugins()
+        assert results == {
+            "task_management.waiting": True,
+            "task_management.signalling": True,
+            "task_management.failing": False,
+        }
+
     @pytest.mark.asyncio
     async def test_cleanup_all_plugins(self):
         """Test cleaning up all plugin instances."""
@@ -217,6 +277,80 @@ class TestPluginRegistry:
         results = await self.registry.cleanup_all_plugins()
         assert results["task_management.mock_plugin"] is True
 
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,attribute,returned,ok_value,fail_value",
+        [
+            ("initialize_all_plugins", "initialize", True, True, False),
+            ("cleanup_all_plugins", "cleanup", True, True, False),
+            (
+                "health_check_all_plugins",
+                "health_check",
+                PluginStatus.HEALTHY,
+                "healthy",
+                "unknown",
+            ),
+        ],
+    )
+    async def test_all_plugins_bounded_concurrency(
+        self, method, attribute, returned, ok_value, fail_value
+    ):
+        """Test lifecycle fan-out is bounded and failures stay isolated."""
+        self.registry.max_concurrent_operations = 2
+        active = 0
+        peak = 0
+
+        async def tracked_operation():
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0)
+            active -= 1
+            return returned
+
+        instances = {}
+        for i in range(5):
+            plugin = MagicMock()
+            setattr(plugin, attribute, AsyncMock(side_effect=tracked_operation))
+            instances[f"task_management.plugin_{i}"] = plugin
+        failing = MagicMock()
+        setattr(failing, attribute, AsyncMock(side_effect=RuntimeError("boom")))
+        instances["task_management.failing"] = failing
+        self.registry._instances = instances
+
+        results = await getattr(self.registry, method)()
+
+        assert peak == 2
+        assert list(results) == list(instances)
+        assert results["task_management.failing"] == fail_value
+        assert all(results[f"task_management.plugin_{i}"] == ok_value for i in range(5))
+
+    @pytest.mark.asyncio
+    async def test_cleanup_all_plugins_snapshots_instances(self):
+        """Test instances removed mid-cleanup are still cleaned up."""
+        self.registry.max_concurrent_operations = 1
+        first = MagicMock()
+        second = MagicMock()
+        second.cleanup = AsyncMock(return_value=True)
+
+        async def remove_second():
+            del self.registry._instances["task_management.second"]
+            return True
+
+        first.cleanup = AsyncMock(side_effect=remove_second)
+        self.registry._instances = {
+            "task_management.first": first,
+            "task_management.second": second,
+        }
+
+        results = await self.registry.cleanup_all_plugins()
+
+        assert results == {
+            "task_management.first": True,
+            "task_management.second": True,
+        }
+        second.cleanup.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_health_check_all_plugins(self):
         """Test health check for all plugin instances."""
@@ -275,6 +409,20 @@ class TestPluginRegistry:
         plugins = self.registry.discover_available_plugins()
         assert "test_plugin" in plugins
 
+    def test_discover_plugins_records_path_once(self, tmp_path):
+        """Test rediscovering a directory re-imports it but records it once."""
+        (tmp_path / "sample_plugin.py").write_text(SAMPLE_PLUGIN_SOURCE)
+
+        with patch(
+            "core.plugin_registry.importlib.util.spec_from_file_location",
+            wraps=importlib.util.spec_from_file_location,
+        ) as spec_loader:
+            assert self.registry.discover_plugins(tmp_path) == 1
+            assert self.registry.discover_plugins(tmp_path / ".." / tmp_path.name) == 1
+            assert spec_loader.call_count == 2
+
+        assert self.registry._plugin_paths == [tmp_path]
+
     def test_execute_tool_not_found(self):
         """Test executing non-existent tool."""
         with pytest.raises(ValueError):
@@ -170,13 +170,13 @@ Please review the pull request and merge when ready."""
             print(f"❌ Jira operations failed: {e}")
             return False
 
-    def cleanup_temp_directory(self):
+    async def cleanup_temp_directory(self):
         """Clean up temp directory after completion."""
         print(f"\n🧹 **CLEANING UP TEMP DIRECTORY**")
 
         try:
             if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
+                await asyncio.to_thread(shutil.rmtree, self.temp_dir)
                 print(f"✅ Temp directory cleaned: {self.temp_dir}")
                 print(f"✅ /temp is empty")
             else:
@@ -216,7 +216,7 @@ Please review the pull request and merge when ready."""
                 return {"success": False, "error": "Failed to complete Jira operations"}
 
             # Cleanup
-            self.cleanup_temp_directory()
+            await self.cleanup_temp_directory()
 
             print(f"\n{'='*80}")
             print(f"✅ **WORKFLOW COMPLETION SUCCESSFUL!**")
@@ -4,6 +4,7 @@ REAL Development Workflow by ID - Simple and Direct
 Uses ./temp directory, launches Claude CLI in repo, cleans up after PR
 """
 
+import asyncio
 import shutil
 import subprocess
 import sys
@@ -288,14 +289,11 @@ The development workflow has been initiated. A development environment will be s
             print(f"   🔄 When you exit Claude CLI, workflow will auto-continue...")
 
             # Wait for the completion marker file with longer timeout
-            import time
-
             max_wait_time = 3600  # 1 hour max wait time
-            wait_time = 0
+            deadline = time.monotonic() + max_wait_time
 
-            while not marker_file.exists() and wait_time < max_wait_time:
+            while not marker_file.exists() and time.monotonic() < deadline:
                 time.sleep(3)  # Check every 3 seconds
-                wait_time += 3
 
             if marker_file.exists():
                 print(f"   ✅ Claude CLI session completed!")
@@ -450,7 +448,7 @@ Please review the pull request and merge when ready."""
             print(f"   ❌ REAL Jira completion comment failed: {str(e)}")
             return False
 
-    def step10_cleanup_temp_directory(self):
+    async def step10_cleanup_temp_directory(self):
         """Step 10: Clean up temp directory after successful workflow."""
         print(f"\n🔟 **CLEANUP TEMP DIRECTORY**")
 
@@ -459,7 +457,7 @@ Please review the pull request and merge when ready."""
             if self.branch_name:
                 print(f"   🧹 Implementation completed, cleaning up temp directory...")
                 if self.temp_dir.exists():
-                    shutil.rmtree(self.temp_dir)
+                    await asyncio.to_thread(shutil.rmtree, self.temp_dir)
                     print(f"   ✅ Temp directory cleaned: {self.temp_dir}")
                     print(f"   ✅ /temp is empty")
                 else:
@@ -541,7 +539,7 @@ Please review the pull request and merge when ready."""
             else:
                 return {"success": False, "error": "Failed to add completion comment"}
 
-            if self.step10_cleanup_temp_directory():
+            if await self.step10_cleanup_temp_directory():
                 steps_completed += 1
 
             # Success summary
@@ -583,7 +581,7 @@ Please review the pull request and merge when ready."""
             print(f"\n❌ **WORKFLOW FAILED**: {str(e)}")
             # Clean up on error
             if self.temp_dir.exists():
-                shutil.rmtree(self.temp_dir)
+                await asyncio.to_thread(shutil.rmtree, self.temp_dir)
             return {
                 "success": False,
                 "error": str(e),